@@ -11,7 +11,7 @@ This example demonstrates:
 """
 
 import asyncio
-from hybrid_agents import HybridPlatform, Task, TaskType, Guardrail, GuardrailType
+from hybrid_agents import HybridPlatform, Task, TaskType, Guardrail, GuardrailType, PatternGuardrail
 
 
 async def main():
@@ -22,10 +22,10 @@ async def main():
 
     # Add code review guardrails
     platform.add_guardrail(
-        Guardrail(
+        PatternGuardrail(
             name="security_review",
             type=GuardrailType.APPROVAL_REQUIRED,
-            condition=lambda task: "security" in task.description.lower() or "auth" in task.description.lower(),
+            patterns=("security", "auth"),
             message="Security-related changes require manual review",
             approver="security-team@company.com"
         )
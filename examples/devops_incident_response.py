@@ -9,7 +9,7 @@ This example demonstrates automated incident response that:
 """
 
 import asyncio
-from hybrid_agents import HybridPlatform, Task, TaskType, Guardrail, GuardrailType
+from hybrid_agents import HybridPlatform, Task, TaskType, Guardrail, GuardrailType, PatternGuardrail
 
 
 async def main():
@@ -21,10 +21,10 @@ async def main():
 
     # Add safety guardrails
     platform.add_guardrail(
-        Guardrail(
+        PatternGuardrail(
             name="production_safety",
             type=GuardrailType.BLOCK,
-            condition=lambda task: "DROP TABLE" in task.description.upper() or "rm -rf /" in task.description,
+            patterns=("DROP TABLE", "rm -rf /", "shutdown -h", "mkfs."),
             message="Blocked: Potentially destructive operation detected"
         )
     )
@@ -33,7 +33,8 @@ async def main():
         Guardrail(
             name="data_privacy",
             type=GuardrailType.APPROVAL_REQUIRED,
-            condition=lambda task: "pii" in task.description.lower() or "personal" in task.description.lower(),
+            condition=lambda task: True,
+            keywords=frozenset({"pii", "personal"}),
             message="PII access requires legal approval",
             approver="legal@company.com"
         )
@@ -162,9 +163,44 @@ async def demo_parallel_processing():
         print(f"  {i}. {result.get('task_id')}: {result.get('platform')}")
 
 
+async def demo_stream_processing():
+    """
+    Demonstrate streaming 10,000+ transaction records through a bounded
+    producer-consumer pipeline instead of one monolithic task
+    """
+    platform = HybridPlatform(
+        openai_api_key="sk-...",
+        anthropic_api_key="sk-ant-..."
+    )
+
+    print("\n" + "=" * 60)
+    print("STREAMING TRANSACTION AUDIT DEMO")
+    print("=" * 60)
+
+    def iter_transactions():
+        # In production this would stream rows from
+        # /data/transactions/q4_2024/*.csv
+        for i in range(10_000):
+            yield {"transaction_id": f"txn_{i:05d}", "amount": 100 + i % 900}
+
+    audit_task = Task(
+        id="audit_q4_2024_stream",
+        type=TaskType.SYSTEM_OPERATION,
+        description="Validate transaction record against SOX controls",
+        requires_system_access=True
+    )
+
+    result = await platform.process_stream(audit_task, iter_transactions(), concurrency=8)
+
+    print(f"\n✅ Audited {result['records_processed']} transactions")
+
+
 if __name__ == "__main__":
     # Run main audit
     asyncio.run(main())
 
     # Optionally demonstrate parallel processing
     # asyncio.run(demo_parallel_processing())
+
+    # Optionally demonstrate streaming record processing
+    # asyncio.run(demo_stream_processing())
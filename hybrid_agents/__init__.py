@@ -3,10 +3,24 @@ Hybrid Agent Framework - OpenAI + Claude Power Duo
 Combine OpenAI's orchestration with Claude's system execution
 """
 
+import os
+
+# Run asyncio on uvloop (libuv-based, substantially faster loop
+# primitives) when it is installed; set HYBRID_AGENTS_NO_UVLOOP to opt
+# out, e.g. when embedding in an app that manages its own loop policy
+if not os.environ.get("HYBRID_AGENTS_NO_UVLOOP"):
+    try:
+        import uvloop
+    except ImportError:
+        pass
+    else:
+        uvloop.install()
+
 from .platform import HybridPlatform
 from .task import Task, TaskType
-from .guardrails import Guardrail, GuardrailType
+from .guardrails import Guardrail, GuardrailType, PatternGuardrail
 from .agents import AgentType, AgentRole
+from .semantic_cache import SemanticCache
 
 __version__ = "0.1.0"
 
@@ -16,6 +30,8 @@ __all__ = [
     "TaskType",
     "Guardrail",
     "GuardrailType",
+    "PatternGuardrail",
     "AgentType",
     "AgentRole",
+    "SemanticCache",
 ]
@@ -0,0 +1,72 @@
+"""
+Multi-pattern keyword scanning for guardrails
+
+Implements an Aho-Corasick automaton so that N keyword guardrails cost a
+single O(len(description)) pass instead of N independent substring
+searches. Pure Python by design: this package ships no compiled
+extensions, and the automaton only kicks in once enough keyword
+guardrails are registered to beat the per-keyword C substring search
+(see GuardrailEngine).
+"""
+
+from collections import deque
+from typing import FrozenSet, Iterable, Set
+
+
+class KeywordAutomaton:
+    """Aho-Corasick automaton over a fixed set of keywords"""
+
+    __slots__ = ("_goto", "_fail", "_output")
+
+    def __init__(self, keywords: Iterable[str]):
+        # State 0 is the root; _goto maps state -> {char: next state}
+        self._goto = [{}]
+        self._output: list = [set()]
+
+        for keyword in keywords:
+            state = 0
+            for char in keyword:
+                nxt = self._goto[state].get(char)
+                if nxt is None:
+                    self._goto.append({})
+                    self._output.append(set())
+                    nxt = len(self._goto) - 1
+                    self._goto[state][char] = nxt
+                state = nxt
+            self._output[state].add(keyword)
+
+        # Breadth-first construction of failure links; outputs are merged
+        # along failure chains so scan() never has to walk them
+        self._fail = [0] * len(self._goto)
+        queue = deque()
+        for child in self._goto[0].values():
+            queue.append(child)
+
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                if self._fail[child] == child:
+                    self._fail[child] = 0
+                self._output[child] |= self._output[self._fail[child]]
+
+    def scan(self, text: str) -> Set[str]:
+        """Return the set of keywords occurring anywhere in text"""
+        matched: Set[str] = set()
+        state = 0
+        goto = self._goto
+        fail = self._fail
+        output = self._output
+
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if output[state]:
+                matched |= output[state]
+
+        return matched
@@ -3,7 +3,8 @@ Agent definitions for hybrid agent framework
 """
 
 from enum import Enum
-from typing import Optional, Dict, Any
+from functools import lru_cache
+from typing import FrozenSet, Optional, Dict, Any
 
 
 class AgentType(str, Enum):
@@ -37,18 +38,48 @@ class AgentCapability:
         "mcp_integration"
     }
 
+    # One bit per known capability, so matching a requirement set is a
+    # bitwise AND plus popcount instead of allocating set intersections
+    _CAPABILITY_BITS = {}
+    _OPENAI_MASK = 0
+    _CLAUDE_MASK = 0
+    for _i, _capability in enumerate(sorted(OPENAI_STRENGTHS | CLAUDE_STRENGTHS)):
+        _CAPABILITY_BITS[_capability] = 1 << _i
+        if _capability in OPENAI_STRENGTHS:
+            _OPENAI_MASK |= 1 << _i
+        if _capability in CLAUDE_STRENGTHS:
+            _CLAUDE_MASK |= 1 << _i
+    del _i, _capability
+
     @classmethod
-    def get_best_platform(cls, requirements: set) -> AgentType:
-        """Determine best platform based on requirements"""
-        openai_match = len(requirements & cls.OPENAI_STRENGTHS)
-        claude_match = len(requirements & cls.CLAUDE_STRENGTHS)
+    def _requirements_mask(cls, requirements: set) -> int:
+        """Pack a requirement set into a capability bitmask"""
+        mask = 0
+        for requirement in requirements:
+            mask |= cls._CAPABILITY_BITS.get(requirement, 0)
+        return mask
+
+    @staticmethod
+    @lru_cache(maxsize=128)
+    def _get_best_platform_cached(requirements: FrozenSet[str]) -> AgentType:
+        """Memoized platform choice; safe because the masks are constants"""
+        req_mask = AgentCapability._requirements_mask(requirements)
+        openai_match = (req_mask & AgentCapability._OPENAI_MASK).bit_count()
+        claude_match = (req_mask & AgentCapability._CLAUDE_MASK).bit_count()
 
         return AgentType.CLAUDE if claude_match > openai_match else AgentType.OPENAI
 
+    @classmethod
+    def get_best_platform(cls, requirements: set) -> AgentType:
+        """Determine best platform based on requirements"""
+        return cls._get_best_platform_cached(frozenset(requirements))
+
 
 class Agent:
     """Base agent class"""
 
+    __slots__ = ("name", "role", "agent_type", "instructions", "context")
+
     def __init__(self, name: str, role: AgentRole, agent_type: AgentType, instructions: str):
         self.name = name
         self.role = role
@@ -2,9 +2,18 @@
 Guardrails for hybrid agent framework
 """
 
-from dataclasses import dataclass
+import ast
+import inspect
+import re
+import textwrap
+from dataclasses import dataclass, field
 from enum import Enum
-from typing import Callable, Any, Optional
+from functools import partial
+from types import CodeType
+from typing import Callable, Any, FrozenSet, Iterable, Optional, Tuple
+
+from .task import TaskType
+from ._guardscan import KeywordAutomaton
 
 
 class GuardrailType(str, Enum):
@@ -16,7 +25,7 @@ class GuardrailType(str, Enum):
     COST_LIMIT = "cost_limit"
 
 
-@dataclass
+@dataclass(slots=True)
 class Guardrail:
     """
     Guardrail definition
@@ -27,37 +36,342 @@ class Guardrail:
         condition: Function that evaluates if guardrail applies
         message: Message to display when guardrail triggers
         approver: Optional approver identifier (email, slack channel, etc.)
+        task_types: Optional task types this guardrail applies to; lets the
+            engine skip evaluation for tasks of other types
+        min_priority: Optional minimum task priority; tasks below it skip
+            this guardrail without calling the condition
+        keywords: Optional keyword prefilter; the condition only runs when
+            at least one keyword occurs in the (casefolded) description
     """
     name: str
     type: GuardrailType
     condition: Callable[[Any], bool]
     message: str
     approver: Optional[str] = None
+    task_types: Optional[Tuple[TaskType, ...]] = None
+    min_priority: Optional[int] = None
+    keywords: Optional[FrozenSet[str]] = None
+    # UTF-8 encodings of keywords, derived at registration; bytes-in-bytes
+    # search hits CPython's memmem fast path without decoding overhead
+    keyword_bytes: Optional[Tuple[bytes, ...]] = field(default=None, repr=False)
+    # Specialized predicate compiled from simple condition lambdas at
+    # registration (see _compile_fast_condition); preferred over the
+    # generic lambda when present
+    _fast: Optional[Callable[[Any], bool]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def evaluate(self, task) -> bool:
         """Evaluate if this guardrail should trigger"""
+        if self._fast is not None:
+            return self._fast(task)
         return self.condition(task)
 
 
+def _depends_only_on_description(condition: Callable) -> bool:
+    """
+    True if a condition can only read task.description
+
+    Checked via the code object: no free variables and no names beyond
+    the description attribute means the result is a pure function of the
+    description string and safe to memoize per (guardrail, description).
+    """
+    code = getattr(condition, "__code__", None)
+    if code is None:
+        return False
+    return not code.co_freevars and set(code.co_names) <= {"description"}
+
+
+def _priority_at_least(threshold: int, task) -> bool:
+    return task.priority >= threshold
+
+
+def _type_is(task_type: TaskType, task) -> bool:
+    return task.type == task_type
+
+
+def _description_contains(keyword: str, task) -> bool:
+    return keyword in task.description
+
+
+def _description_contains_folded(keyword: str, task) -> bool:
+    return keyword in task.description.casefold()
+
+
+def _matches_condition(node: ast.Lambda, condition: Callable) -> bool:
+    """
+    True if a recovered lambda AST compiles to the same code as condition
+
+    Source recovery is heuristic (it takes the first parseable lambda on
+    the statement), so before trusting the AST we compile it and require
+    the bytecode, constants and names to match the function the caller
+    actually passed. Anything else — several lambdas on one line, a
+    trimmed ternary — is rejected rather than risking a specialized
+    predicate that enforces a different rule.
+    """
+    try:
+        module_code = compile(
+            ast.Expression(body=ast.fix_missing_locations(node)),
+            "<guardrail>", "eval"
+        )
+    except (SyntaxError, ValueError):
+        return False
+    compiled = next(
+        (const for const in module_code.co_consts if isinstance(const, CodeType)),
+        None
+    )
+    original = condition.__code__
+    return (compiled is not None
+            and compiled.co_code == original.co_code
+            and compiled.co_consts == original.co_consts
+            and compiled.co_names == original.co_names)
+
+
+def _parse_lambda(condition: Callable) -> Optional[ast.Lambda]:
+    """Recover the AST of a lambda condition, or None if unavailable"""
+    try:
+        source = textwrap.dedent(inspect.getsource(condition))
+    except (OSError, TypeError):
+        return None
+
+    # getsource returns the enclosing statement (often a call argument);
+    # trim from the lambda keyword until the expression parses
+    start = source.find("lambda")
+    if start < 0:
+        return None
+    snippet = source[start:].strip()
+    while snippet:
+        try:
+            tree = ast.parse(snippet, mode="eval")
+            break
+        except SyntaxError:
+            snippet = snippet[:-1].rstrip()
+    else:
+        return None
+
+    node = tree.body
+    # A trailing comma from a call argument parses as a 1-tuple
+    if isinstance(node, ast.Tuple) and len(node.elts) == 1:
+        node = node.elts[0]
+    if (isinstance(node, ast.Lambda) and len(node.args.args) == 1
+            and _matches_condition(node, condition)):
+        return node
+    return None
+
+
+def _compile_fast_condition(condition: Callable) -> Optional[Callable[[Any], bool]]:
+    """
+    Compile a simple condition lambda to a specialized predicate
+
+    Recognizes `task.priority >= N`, `task.type == TaskType.X` and
+    `"kw" in task.description[.lower()/.casefold()]` and returns a
+    precomputed partial for them, skipping generic lambda dispatch per
+    task. Returns None for anything it does not recognize.
+    """
+    node = _parse_lambda(condition)
+    if node is None:
+        return None
+
+    arg = node.args.args[0].arg
+    body = node.body
+    if not (isinstance(body, ast.Compare) and len(body.ops) == 1):
+        return None
+    op = body.ops[0]
+    left, right = body.left, body.comparators[0]
+
+    def _is_task_attr(expr, attr):
+        return (isinstance(expr, ast.Attribute) and expr.attr == attr
+                and isinstance(expr.value, ast.Name) and expr.value.id == arg)
+
+    # task.priority >= N
+    if (isinstance(op, ast.GtE) and _is_task_attr(left, "priority")
+            and isinstance(right, ast.Constant) and isinstance(right.value, int)):
+        return partial(_priority_at_least, right.value)
+
+    # task.type == TaskType.X (or `is`)
+    if (isinstance(op, (ast.Eq, ast.Is)) and _is_task_attr(left, "type")
+            and isinstance(right, ast.Attribute)
+            and isinstance(right.value, ast.Name) and right.value.id == "TaskType"
+            and right.attr in TaskType.__members__):
+        return partial(_type_is, TaskType[right.attr])
+
+    # "kw" in task.description / task.description.lower() / .casefold()
+    if (isinstance(op, ast.In) and isinstance(left, ast.Constant)
+            and isinstance(left.value, str)):
+        if _is_task_attr(right, "description"):
+            return partial(_description_contains, left.value)
+        if (isinstance(right, ast.Call) and not right.args and not right.keywords
+                and isinstance(right.func, ast.Attribute)
+                and right.func.attr in ("lower", "casefold")
+                and _is_task_attr(right.func.value, "description")):
+            return partial(_description_contains_folded, left.value.casefold())
+
+    return None
+
+
+class PatternGuardrail(Guardrail):
+    """
+    Guardrail matching any of several literal patterns in one pass
+
+    The patterns are compiled into a single case-insensitive regex
+    alternation, so evaluation is one C-level scan over the description
+    instead of one `.upper()` copy plus a substring search per pattern.
+    """
+
+    __slots__ = ("patterns", "_regex")
+
+    def __init__(self, name: str, type: GuardrailType, patterns: Iterable[str],
+                 message: str, approver: Optional[str] = None,
+                 task_types: Optional[Tuple[TaskType, ...]] = None,
+                 min_priority: Optional[int] = None):
+        self.patterns = tuple(patterns)
+        self._regex = re.compile(
+            "|".join(re.escape(p) for p in self.patterns),
+            re.IGNORECASE
+        )
+        super().__init__(
+            name=name,
+            type=type,
+            condition=self.evaluate,
+            message=message,
+            approver=approver,
+            task_types=task_types,
+            min_priority=min_priority
+        )
+
+    def evaluate(self, task) -> bool:
+        """Scan the task description for any configured pattern"""
+        return self._regex.search(task.description) is not None
+
+
 class GuardrailEngine:
-    """Engine for evaluating guardrails"""
+    """
+    Engine for evaluating guardrails
+
+    Guardrails with structured metadata (task_types, min_priority) are
+    bucketed at registration time so each check only evaluates the subset
+    that can possibly apply to the task, instead of scanning every rule.
+    """
+
+    # Below this many keyword guardrails, per-keyword substring search
+    # (C-level memmem) beats the automaton's Python char loop
+    _AUTOMATON_MIN = 16
+
+    # Bound on the memoized-evaluation cache; cleared wholesale when full
+    # (recurring descriptions repopulate it in one pass)
+    _EVAL_CACHE_MAX = 4096
 
     def __init__(self):
         self.guardrails = []
+        # Guardrails restricted to specific task types, bucketed by type
+        self._by_type: dict = {}
+        # Guardrails that apply regardless of task type
+        self._untyped = []
+        # Keyword guardrails plus a lazily-built Aho-Corasick automaton
+        # covering all their keywords in one scan
+        self._keyword_guardrails = []
+        self._keyword_automaton: Optional[KeywordAutomaton] = None
+        # Memoized evaluations keyed by (id(guardrail), description), only
+        # for guardrails whose condition is a pure function of description
+        self._eval_cache: dict = {}
+        self._memoizable_ids: set = set()
 
     def add_guardrail(self, guardrail: Guardrail):
         """Add a guardrail"""
         self.guardrails.append(guardrail)
 
+        if type(guardrail) is Guardrail and guardrail._fast is None:
+            guardrail._fast = _compile_fast_condition(guardrail.condition)
+
+        # Recurring descriptions (retries, idempotent re-runs) skip the
+        # substring scan entirely when the verdict is already cached
+        predicate = guardrail._fast if guardrail._fast is not None else guardrail.condition
+        if (isinstance(guardrail, PatternGuardrail)
+                or _depends_only_on_description(
+                    predicate.func if isinstance(predicate, partial) else predicate)):
+            self._memoizable_ids.add(id(guardrail))
+        self._eval_cache.clear()
+
+        # Substring lambdas compile to _description_contains* partials;
+        # surface their literal as a keyword so many such guardrails share
+        # the engine's single multi-pattern scan instead of one substring
+        # search each (the condition still confirms the exact match).
+        # Only validated fast paths reach here — a wrongly recovered
+        # literal would make the keyword prefilter skip the real condition
+        # and disable the guardrail outright
+        if (guardrail.keywords is None and isinstance(guardrail._fast, partial)
+                and guardrail._fast.func in (_description_contains,
+                                             _description_contains_folded)):
+            guardrail.keywords = frozenset(guardrail._fast.args)
+
+        if guardrail.keywords is not None:
+            # Normalize once so checks compare against the casefolded
+            # description without re-lowering per keyword
+            guardrail.keywords = frozenset(k.casefold() for k in guardrail.keywords)
+            guardrail.keyword_bytes = tuple(k.encode("utf-8") for k in guardrail.keywords)
+            self._keyword_guardrails.append(guardrail)
+            self._keyword_automaton = None
+
+        if guardrail.task_types is not None:
+            for task_type in guardrail.task_types:
+                self._by_type.setdefault(task_type, []).append(guardrail)
+        else:
+            self._untyped.append(guardrail)
+
+    def _candidates(self, task):
+        """Yield only the guardrails that can apply to this task"""
+        for guardrail in self._untyped:
+            yield guardrail
+        for guardrail in self._by_type.get(task.type, ()):
+            yield guardrail
+
     def check(self, task) -> tuple[bool, Optional[str], Optional[Guardrail]]:
         """
-        Check all guardrails for a task
+        Check applicable guardrails for a task
 
         Returns:
             (can_proceed, message, triggered_guardrail)
         """
-        for guardrail in self.guardrails:
-            if guardrail.evaluate(task):
+        # Casefold the description once per task instead of once per
+        # keyword-matching guardrail
+        desc_cf = task.description.casefold()
+
+        # With enough keyword guardrails, find every matched keyword in a
+        # single automaton pass instead of one search per keyword
+        matched_keywords = None
+        desc_bytes = b""
+        if self._keyword_guardrails:
+            if len(self._keyword_guardrails) >= self._AUTOMATON_MIN:
+                if self._keyword_automaton is None:
+                    all_keywords = set()
+                    for keyword_guardrail in self._keyword_guardrails:
+                        all_keywords |= keyword_guardrail.keywords
+                    self._keyword_automaton = KeywordAutomaton(all_keywords)
+                matched_keywords = self._keyword_automaton.scan(desc_cf)
+            else:
+                # Encode once; per-keyword matching below runs on bytes
+                desc_bytes = desc_cf.encode("utf-8")
+
+        for guardrail in self._candidates(task):
+            if guardrail.min_priority is not None and task.priority < guardrail.min_priority:
+                continue
+            if guardrail.keywords is not None:
+                if matched_keywords is not None:
+                    if matched_keywords.isdisjoint(guardrail.keywords):
+                        continue
+                elif not any(k in desc_bytes for k in guardrail.keyword_bytes):
+                    continue
+            if id(guardrail) in self._memoizable_ids:
+                cache_key = (id(guardrail), task.description)
+                triggered = self._eval_cache.get(cache_key)
+                if triggered is None:
+                    triggered = guardrail.evaluate(task)
+                    if len(self._eval_cache) >= self._EVAL_CACHE_MAX:
+                        self._eval_cache.clear()
+                    self._eval_cache[cache_key] = triggered
+            else:
+                triggered = guardrail.evaluate(task)
+            if triggered:
                 if guardrail.type == GuardrailType.BLOCK:
                     return False, guardrail.message, guardrail
                 elif guardrail.type == GuardrailType.APPROVAL_REQUIRED:
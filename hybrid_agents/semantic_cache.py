@@ -0,0 +1,64 @@
+"""
+Semantic cache for hybrid agent framework
+
+Matches semantically similar task descriptions (e.g. "Review PR #456 for
+auth middleware" vs "Audit PR 456 authentication changes") that an
+exact-match cache would miss, using cosine similarity over embeddings
+produced by a pluggable embedding function.
+"""
+
+import math
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+
+def _normalize(vector: Sequence[float]) -> List[float]:
+    """L2-normalize a vector so cosine similarity reduces to a dot product"""
+    norm = math.sqrt(sum(v * v for v in vector))
+    if norm == 0.0:
+        return list(vector)
+    return [v / norm for v in vector]
+
+
+class SemanticCache:
+    """
+    Cosine-similarity cache over task descriptions
+
+    Args:
+        embed_fn: Function mapping a description string to an embedding
+            vector (e.g. an OpenAI text-embedding-3-small call)
+        threshold: Minimum cosine similarity for a cache hit
+    """
+
+    def __init__(self, embed_fn: Callable[[str], Sequence[float]], threshold: float = 0.92):
+        self.embed_fn = embed_fn
+        self.threshold = threshold
+        self._embeddings: List[List[float]] = []
+        self._results: List[Dict[str, Any]] = []
+
+    def lookup(self, description: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result closest to description, if similar enough"""
+        if not self._embeddings:
+            return None
+
+        query = _normalize(self.embed_fn(description))
+
+        best_score = -1.0
+        best_index = -1
+        for i, embedding in enumerate(self._embeddings):
+            score = sum(q * e for q, e in zip(query, embedding))
+            if score > best_score:
+                best_score = score
+                best_index = i
+
+        if best_score >= self.threshold:
+            return self._results[best_index]
+
+        return None
+
+    def insert(self, description: str, result: Dict[str, Any]):
+        """Cache a result under the embedding of description"""
+        self._embeddings.append(_normalize(self.embed_fn(description)))
+        self._results.append(result)
+
+    def __len__(self) -> int:
+        return len(self._results)
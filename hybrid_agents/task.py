@@ -4,12 +4,50 @@ Task definitions for hybrid agent framework
 
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, Any, Optional
+from typing import Dict, Any, List, Optional
 from datetime import datetime
-import uuid
+import os
+import time
+from asyncio import get_running_loop
 
+# Captured once at import so monotonic timestamps can be mapped back to
+# wall-clock datetimes at serialization time without per-call datetime.now()
+_EPOCH_OFFSET_NS = time.time_ns() - time.monotonic_ns()
 
-class TaskType(str, Enum):
+
+# Clock reads cached per event-loop iteration, keyed by loop; cleared via
+# call_soon so tasks stamped in the same tick share one monotonic_ns read
+_TICK_CACHE: Dict[Any, int] = {}
+
+
+def _now_ns() -> int:
+    """
+    Current monotonic time in nanoseconds, cached per event-loop tick
+
+    Bursts of tasks marked within one loop iteration land on the same
+    wall-clock microsecond anyway, so one clock read per tick is enough;
+    outside a running loop this falls through to a plain monotonic_ns().
+    """
+    try:
+        loop = get_running_loop()
+    except RuntimeError:
+        return time.monotonic_ns()
+    now = _TICK_CACHE.get(loop)
+    if now is None:
+        now = time.monotonic_ns()
+        _TICK_CACHE[loop] = now
+        loop.call_soon(_TICK_CACHE.pop, loop, None)
+    return now
+
+
+def _to_datetime(monotonic_ns: Optional[int]) -> Optional[datetime]:
+    """Convert a stored monotonic-ns timestamp to a wall-clock datetime"""
+    if monotonic_ns is None:
+        return None
+    return datetime.fromtimestamp((monotonic_ns + _EPOCH_OFFSET_NS) / 1e9)
+
+
+class TaskType(Enum):
     """Types of tasks that can be executed"""
     CONVERSATION = "conversation"
     SYSTEM_OPERATION = "system_operation"
@@ -20,7 +58,7 @@ class TaskType(str, Enum):
     INCIDENT_RESPONSE = "incident_response"
 
 
-class TaskStatus(str, Enum):
+class TaskStatus(Enum):
     """Task execution status"""
     PENDING = "pending"
     ROUTING = "routing"
@@ -31,43 +69,139 @@ class TaskStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-@dataclass
+@dataclass(slots=True)
 class Task:
     """Unified task representation for hybrid agent platform"""
 
     description: str
     type: TaskType = TaskType.CONVERSATION
-    id: str = field(default_factory=lambda: str(uuid.uuid4()))
+    # 32 hex chars straight from urandom; same entropy as uuid4 without
+    # the UUID object construction and version-bit formatting
+    id: str = field(default_factory=lambda: os.urandom(16).hex())
     requires_system_access: bool = False
     requires_multi_step: bool = False
-    context: Optional[Dict[str, Any]] = None
+    context: Dict[str, Any] = field(default_factory=dict)
     priority: int = 3
     estimated_cost: float = 0.0
     timeout: int = 300
 
+    # Optional DAG decomposition: sub-tasks run concurrently where
+    # depends_on (list of sub-task ids) allows
+    subtasks: List["Task"] = field(default_factory=list)
+    depends_on: List[str] = field(default_factory=list)
+
+    # Timestamps are integer nanoseconds from time.monotonic_ns(); cheaper
+    # to stamp than datetime.now() and converted to datetimes lazily via
+    # the *_dt properties when history is serialized
     status: TaskStatus = TaskStatus.PENDING
-    created_at: datetime = field(default_factory=datetime.now)
-    started_at: Optional[datetime] = None
-    completed_at: Optional[datetime] = None
+    created_at: int = field(default_factory=_now_ns)
+    started_at: Optional[int] = None
+    completed_at: Optional[int] = None
     assigned_platform: Optional[str] = None
     result: Optional[Dict[str, Any]] = None
     error: Optional[str] = None
 
-    def __post_init__(self):
-        if self.context is None:
-            self.context = {}
+    def reset(self, id: str, type: TaskType, description: str,
+              requires_system_access: bool = False):
+        """
+        Re-initialize this instance for reuse from an object pool
+
+        Clears all execution state back to a pristine pending task;
+        used by the hybrid pipeline to recycle stage tasks instead of
+        allocating fresh ones per invocation.
+        """
+        self.id = id
+        self.type = type
+        self.description = description
+        self.requires_system_access = requires_system_access
+        self.requires_multi_step = False
+        self.context = {}
+        self.priority = 3
+        self.estimated_cost = 0.0
+        self.timeout = 300
+        self.subtasks = []
+        self.depends_on = []
+        self.status = TaskStatus.PENDING
+        self.created_at = _now_ns()
+        self.started_at = None
+        self.completed_at = None
+        self.assigned_platform = None
+        self.result = None
+        self.error = None
+
+    @property
+    def created_at_dt(self) -> datetime:
+        """Creation time as a wall-clock datetime (for serialization)"""
+        return _to_datetime(self.created_at)
+
+    @property
+    def started_at_dt(self) -> Optional[datetime]:
+        """Start time as a wall-clock datetime (for serialization)"""
+        return _to_datetime(self.started_at)
+
+    @property
+    def completed_at_dt(self) -> Optional[datetime]:
+        """Completion time as a wall-clock datetime (for serialization)"""
+        return _to_datetime(self.completed_at)
+
+    @property
+    def execution_time(self) -> Optional[float]:
+        """Wall-clock execution duration in seconds, if finished"""
+        if self.started_at is None or self.completed_at is None:
+            return None
+        return (self.completed_at - self.started_at) / 1e9
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Project the task onto a plain dict for history/serialization"""
+        return {
+            "id": self.id,
+            "description": self.description,
+            "type": self.type.value,
+            "status": self.status.value,
+            "priority": self.priority,
+            "requires_system_access": self.requires_system_access,
+            "requires_multi_step": self.requires_multi_step,
+            "context": self.context,
+            "assigned_platform": self.assigned_platform,
+            "created_at": self.created_at_dt,
+            "started_at": self.started_at_dt,
+            "completed_at": self.completed_at_dt,
+            "execution_time": self.execution_time,
+            "result": self.result,
+            "error": self.error,
+        }
 
     def mark_started(self, platform: str):
         self.status = TaskStatus.IN_PROGRESS
-        self.started_at = datetime.now()
+        self.started_at = _now_ns()
         self.assigned_platform = platform
 
     def mark_completed(self, result: Dict[str, Any]):
         self.status = TaskStatus.COMPLETED
-        self.completed_at = datetime.now()
+        self.completed_at = _now_ns()
         self.result = result
 
     def mark_failed(self, error: str):
         self.status = TaskStatus.FAILED
-        self.completed_at = datetime.now()
+        self.completed_at = _now_ns()
         self.error = error
+
+
+# Value -> member lookup tables; a plain dict hash beats Enum.__call__'s
+# several Python frames when deserializing type/status strings in bulk
+_TYPE_CACHE = {member.value: member for member in TaskType}
+_STATUS_CACHE = {member.value: member for member in TaskStatus}
+
+
+def _make_from_str(cache: Dict[str, Any], enum_name: str):
+    def from_str(value: str):
+        try:
+            return cache[value]
+        except KeyError:
+            # Same contract as Enum.__call__ so callers can swap freely
+            raise ValueError(f"{value!r} is not a valid {enum_name}") from None
+    return from_str
+
+
+TaskType.from_str = staticmethod(_make_from_str(_TYPE_CACHE, "TaskType"))
+TaskStatus.from_str = staticmethod(_make_from_str(_STATUS_CACHE, "TaskStatus"))
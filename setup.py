@@ -33,7 +33,9 @@ setup(
         "openai-agents>=0.1.0",
         "anthropic>=0.18.0",
         "pydantic>=2.0.0",
-        "aiohttp>=3.9.0",
+        "httpx[http2]>=0.27.0",
+        "orjson>=3.9.0",
+        "uvloop>=0.19.0; sys_platform != 'win32'",
         "python-dotenv>=1.0.0",
     ],
     extras_require={
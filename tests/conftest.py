@@ -0,0 +1,66 @@
+"""
+Shared pytest fixtures for the hybrid agent test suite
+"""
+
+import asyncio
+
+import pytest
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+
+if uvloop is not None:
+    @pytest.fixture(scope="session")
+    def event_loop_policy():
+        """Run the suite on uvloop, matching production"""
+        return uvloop.EventLoopPolicy()
+
+
+# Canned provider responses served by the in-process mock transport
+_MOCK_ROUTES = {
+    "/v1/chat/completions": {
+        "choices": [{"message": {"role": "assistant", "content": "ok"}}]
+    },
+    "/v1/messages": {
+        "content": [{"type": "text", "text": "ok"}]
+    },
+}
+
+
+def _mock_llm_handler(request):
+    """Serve canned OpenAI/Anthropic JSON without touching the network"""
+    body = _MOCK_ROUTES.get(request.url.path)
+    if body is None:
+        return httpx.Response(404, json={"error": "unknown route"})
+    return httpx.Response(200, json=body)
+
+
+@pytest.fixture(scope="session")
+def shared_http_client():
+    """
+    One in-process HTTP client shared by every platform in this session
+
+    Built once per session so no test pays client/pool setup, and backed
+    by httpx.MockTransport serving canned provider responses — the real
+    HTTP request/response code path runs with zero network and zero
+    server-start overhead. Yields None when httpx is not installed;
+    HybridPlatform then lazily creates its own client.
+    """
+    if httpx is None:
+        yield None
+        return
+
+    client = httpx.AsyncClient(
+        transport=httpx.MockTransport(_mock_llm_handler),
+        timeout=60.0
+    )
+    yield client
+    asyncio.run(client.aclose())
@@ -4,49 +4,63 @@ Tests for HybridPlatform core functionality
 
 import pytest
 import asyncio
-from hybrid_agents import HybridPlatform, Task, TaskType, Guardrail, GuardrailType
+from hybrid_agents import HybridPlatform, Task, TaskType, Guardrail, GuardrailType, PatternGuardrail
 
 
 @pytest.fixture
-def platform():
-    """Create platform instance for testing"""
+def platform(shared_http_client):
+    """Create platform instance for testing (HTTP pool shared per session)"""
     return HybridPlatform(
         openai_api_key="test-key",
-        anthropic_api_key="test-key"
+        anthropic_api_key="test-key",
+        http_client=shared_http_client
     )
 
 
+class TestEnumParsing:
+    """Test cached enum string parsing"""
+
+    def test_from_str_returns_members(self):
+        """Known value strings should resolve to the enum members"""
+        from hybrid_agents.task import TaskStatus
+
+        assert TaskType.from_str("conversation") is TaskType.CONVERSATION
+        assert TaskStatus.from_str("completed") is TaskStatus.COMPLETED
+
+    def test_from_str_rejects_unknown_values(self):
+        """Unknown values should raise ValueError like Enum.__call__"""
+        with pytest.raises(ValueError):
+            TaskType.from_str("teleportation")
+
+
 class TestTaskRouting:
     """Test intelligent task routing"""
 
-    @pytest.mark.asyncio
-    async def test_route_system_access_to_claude(self, platform):
+    def test_route_system_access_to_claude(self, platform):
         """Tasks requiring system access should route to Claude"""
         task = Task(
             description="Check server health",
             requires_system_access=True
         )
-        result = await platform.route_task(task)
+        result = platform.route_task(task)
         assert result == "claude"
 
-    @pytest.mark.asyncio
-    async def test_route_multi_step_to_hybrid(self, platform):
+    def test_route_multi_step_to_hybrid(self, platform):
         """Multi-step tasks should use hybrid workflow"""
         task = Task(
             description="Complex analysis",
             requires_multi_step=True
         )
-        result = await platform.route_task(task)
+        result = platform.route_task(task)
         assert result == "hybrid"
 
-    @pytest.mark.asyncio
-    async def test_route_conversation_to_openai(self, platform):
+    def test_route_conversation_to_openai(self, platform):
         """Conversational tasks should route to OpenAI"""
         task = Task(
             description="Explain quantum computing",
             type=TaskType.CONVERSATION
         )
-        result = await platform.route_task(task)
+        result = platform.route_task(task)
         assert result == "openai"
 
 
@@ -64,6 +78,221 @@ class TestGuardrails:
         platform.add_guardrail(guardrail)
         assert len(platform.guardrails.guardrails) == 1
 
+    def test_pattern_guardrail_matches_case_insensitively(self, platform):
+        """PatternGuardrail should match any pattern regardless of case"""
+        guardrail = PatternGuardrail(
+            name="production_safety",
+            type=GuardrailType.BLOCK,
+            patterns=("DROP TABLE", "rm -rf /"),
+            message="Destructive operation blocked"
+        )
+        platform.add_guardrail(guardrail)
+
+        assert guardrail.evaluate(Task(description="drop table users"))
+        assert guardrail.evaluate(Task(description="Please run rm -rf / now"))
+        assert not guardrail.evaluate(Task(description="List the tables"))
+
+    def test_keyword_prefilter_gates_condition(self, platform):
+        """Keyword guardrails should only evaluate on matching descriptions"""
+        evaluated = []
+        platform.add_guardrail(
+            Guardrail(
+                name="data_privacy",
+                type=GuardrailType.APPROVAL_REQUIRED,
+                condition=lambda task: evaluated.append(task.id) or True,
+                keywords=frozenset({"PII", "personal"}),
+                message="PII access requires approval",
+                approver="legal@company.com"
+            )
+        )
+
+        can_proceed, _, _ = platform.guardrails.check(Task(description="Summarize sales"))
+        assert can_proceed
+        assert evaluated == []
+
+        can_proceed, _, _ = platform.guardrails.check(Task(description="Export PII records"))
+        assert not can_proceed
+        assert len(evaluated) == 1
+
+    def test_simple_conditions_compile_to_fast_paths(self, platform):
+        """Recognizable lambda patterns should get specialized predicates"""
+        priority_rule = Guardrail(
+            name="priority",
+            type=GuardrailType.APPROVAL_REQUIRED,
+            condition=lambda task: task.priority >= 4,
+            message="High priority",
+            approver="ops@company.com"
+        )
+        keyword_rule = Guardrail(
+            name="keyword",
+            type=GuardrailType.BLOCK,
+            condition=lambda task: "secret" in task.description.lower(),
+            message="Secret blocked"
+        )
+        context_rule = Guardrail(
+            name="context",
+            type=GuardrailType.BLOCK,
+            condition=lambda task: task.context.get("breaking", False),
+            message="Breaking change"
+        )
+        for rule in (priority_rule, keyword_rule, context_rule):
+            platform.add_guardrail(rule)
+
+        assert priority_rule._fast is not None
+        assert keyword_rule._fast is not None
+        assert context_rule._fast is None  # unrecognized: generic lambda path
+
+        assert priority_rule.evaluate(Task(description="x", priority=5))
+        assert not priority_rule.evaluate(Task(description="x", priority=1))
+        assert keyword_rule.evaluate(Task(description="The SECRET plan"))
+        assert context_rule.evaluate(Task(description="x", context={"breaking": True}))
+
+    def test_many_keyword_guardrails_use_automaton_scan(self, platform):
+        """Above the threshold, keyword matching should use one automaton pass"""
+        for i in range(20):
+            platform.add_guardrail(
+                Guardrail(
+                    name=f"kw_{i}",
+                    type=GuardrailType.BLOCK,
+                    condition=lambda task: True,
+                    keywords=frozenset({f"forbidden{i}"}),
+                    message=f"Keyword {i} blocked"
+                )
+            )
+
+        can_proceed, _, triggered = platform.guardrails.check(
+            Task(description="This mentions forbidden7 explicitly")
+        )
+        assert not can_proceed
+        assert triggered.name == "kw_7"
+        assert platform.guardrails._keyword_automaton is not None
+
+        can_proceed, _, _ = platform.guardrails.check(Task(description="All clear"))
+        assert can_proceed
+
+    def test_typed_guardrail_skips_other_task_types(self, platform):
+        """Guardrails scoped by task_types should not see other types"""
+        evaluated = []
+        platform.add_guardrail(
+            Guardrail(
+                name="analysis_only",
+                type=GuardrailType.BLOCK,
+                condition=lambda task: evaluated.append(task.id) or False,
+                message="Analysis blocked",
+                task_types=(TaskType.ANALYSIS,)
+            )
+        )
+
+        platform.guardrails.check(Task(description="Chat", type=TaskType.CONVERSATION))
+        assert evaluated == []
+
+        analysis = Task(description="Crunch numbers", type=TaskType.ANALYSIS)
+        platform.guardrails.check(analysis)
+        assert evaluated == [analysis.id]
+
+    def test_min_priority_guardrail_skips_low_priority(self, platform):
+        """Guardrails with min_priority should ignore lower-priority tasks"""
+        platform.add_guardrail(
+            Guardrail(
+                name="high_priority_approval",
+                type=GuardrailType.APPROVAL_REQUIRED,
+                condition=lambda task: True,
+                message="Needs approval",
+                approver="ops@company.com",
+                min_priority=4
+            )
+        )
+
+        can_proceed, _, _ = platform.guardrails.check(Task(description="Low", priority=2))
+        assert can_proceed
+
+        can_proceed, _, _ = platform.guardrails.check(Task(description="High", priority=5))
+        assert not can_proceed
+
+    def test_ambiguous_lambda_source_keeps_generic_path(self, platform):
+        """Recovered lambda ASTs must match the actual condition's code"""
+        # Two lambdas on one line: source recovery finds the first, which
+        # is NOT the condition being registered and must be rejected
+        a = lambda task: task.priority >= 9; b = lambda task: task.priority >= 2  # noqa: E731,E702
+        guardrail = Guardrail(
+            name="approval_above_two",
+            type=GuardrailType.APPROVAL_REQUIRED,
+            condition=b,
+            message="Needs approval",
+            approver="ops@company.com"
+        )
+        platform.add_guardrail(guardrail)
+        assert guardrail._fast is None
+
+        # The real condition (priority >= 2) is enforced, not the first
+        # lambda on the line (priority >= 9)
+        can_proceed, _, _ = platform.guardrails.check(
+            Task(description="Mid", priority=5)
+        )
+        assert not can_proceed
+
+    def test_substring_lambdas_register_as_keywords(self, platform):
+        """Substring conditions should join the keyword multi-pattern scan"""
+        guardrail = Guardrail(
+            name="block_drop_table",
+            type=GuardrailType.BLOCK,
+            condition=lambda task: "DROP TABLE" in task.description,
+            message="Destructive operation blocked"
+        )
+        platform.add_guardrail(guardrail)
+        assert guardrail.keywords == frozenset({"drop table"})
+        assert guardrail in platform.guardrails._keyword_guardrails
+
+        can_proceed, _, _ = platform.guardrails.check(
+            Task(description="DROP TABLE users")
+        )
+        assert not can_proceed
+
+        # Casefolded prefilter hit but exact condition still enforced
+        can_proceed, _, _ = platform.guardrails.check(
+            Task(description="drop table users")
+        )
+        assert can_proceed
+
+    def test_ambiguous_substring_lambda_registers_no_keywords(self, platform):
+        """Unverifiable substring lambdas must not feed the keyword prefilter"""
+        # If the first lambda's literal were registered as b's keyword,
+        # the prefilter would never let b's real condition run
+        a = lambda task: "rm -rf" in task.description; b = lambda task: "reboot" in task.description  # noqa: E731,E702
+        guardrail = Guardrail(
+            name="block_reboot",
+            type=GuardrailType.BLOCK,
+            condition=b,
+            message="Blocked"
+        )
+        platform.add_guardrail(guardrail)
+        assert guardrail.keywords is None
+
+        can_proceed, _, _ = platform.guardrails.check(
+            Task(description="reboot the host")
+        )
+        assert not can_proceed
+
+    def test_description_only_conditions_are_memoized(self, platform):
+        """Repeated descriptions should hit the memoized verdict"""
+        guardrail = Guardrail(
+            name="block_drop",
+            type=GuardrailType.BLOCK,
+            condition=lambda task: "drop" in task.description,
+            message="Blocked"
+        )
+        platform.add_guardrail(guardrail)
+        engine = platform.guardrails
+        assert id(guardrail) in engine._memoizable_ids
+
+        can_proceed, _, _ = engine.check(Task(description="drop the index"))
+        assert not can_proceed
+        assert engine._eval_cache[(id(guardrail), "drop the index")] is True
+
+        # Same description again resolves from the cache to the same verdict
+        can_proceed, _, _ = engine.check(Task(description="drop the index"))
+        assert not can_proceed
+
     @pytest.mark.asyncio
     async def test_guardrail_blocks_task(self, platform):
         """Guardrail should block matching tasks"""
@@ -106,6 +335,41 @@ class TestTaskExecution:
         assert result["task_id"] == task.id
         assert task.status.value == "completed"
 
+    @pytest.mark.asyncio
+    async def test_dag_execution(self, platform):
+        """Sub-tasks should run as a DAG respecting depends_on"""
+        task = Task(
+            description="Audit documents",
+            requires_multi_step=True,
+            subtasks=[
+                Task(id="parse_csv", description="Parse transaction records"),
+                Task(id="parse_pdf", description="Extract bank statements"),
+                Task(
+                    id="summarize",
+                    description="Summarize parsed documents",
+                    depends_on=["parse_csv", "parse_pdf"]
+                ),
+            ]
+        )
+        result = await platform.execute_hybrid_workflow(task)
+
+        assert result["platform"] == "hybrid"
+        assert set(result["subtask_results"]) == {"parse_csv", "parse_pdf", "summarize"}
+        assert task.status.value == "completed"
+
+    @pytest.mark.asyncio
+    async def test_dag_cycle_detected(self, platform):
+        """Cyclic sub-task dependencies should raise"""
+        task = Task(
+            description="Broken DAG",
+            subtasks=[
+                Task(id="a", description="A", depends_on=["b"]),
+                Task(id="b", description="B", depends_on=["a"]),
+            ]
+        )
+        with pytest.raises(ValueError, match="cyclic"):
+            await platform.execute_hybrid_workflow(task)
+
     @pytest.mark.asyncio
     async def test_hybrid_workflow(self, platform):
         """Should execute hybrid workflow with multiple stages"""
@@ -122,6 +386,109 @@ class TestTaskExecution:
         assert "verification" in result["stages"]
 
 
+class TestStreamProcessing:
+    """Test streaming producer-consumer record processing"""
+
+    @pytest.mark.asyncio
+    async def test_process_stream_handles_all_records(self, platform):
+        """Every record should be processed exactly once"""
+        task = Task(description="Validate transaction record")
+        records = [{"transaction_id": i} for i in range(20)]
+
+        result = await platform.process_stream(task, iter(records), concurrency=4)
+
+        assert result["records_processed"] == 20
+        assert task.status.value == "completed"
+
+    @pytest.mark.asyncio
+    async def test_failing_consumer_cancels_producer(self, platform):
+        """A consumer exception should tear down the stream, producer included"""
+        async def failing_execute(record_task):
+            raise RuntimeError("record exploded")
+
+        platform.execute_with_claude = failing_execute
+        task = Task(description="Validate transaction record")
+
+        # Far more records than the queue holds, so an orphaned producer
+        # would stay blocked on queue.put
+        with pytest.raises(Exception) as excinfo:
+            await platform.process_stream(task, iter(range(100)), concurrency=2)
+
+        causes = (excinfo.value.exceptions
+                  if isinstance(excinfo.value, BaseExceptionGroup)
+                  else (excinfo.value,))
+        assert any(isinstance(e, RuntimeError) for e in causes)
+        assert task.status.value == "failed"
+
+
+class TestResponseCache:
+    """Test exact-match response caching"""
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_on_repeated_description(self, platform):
+        """Identical tasks should be served from cache on repeat"""
+        first = await platform.execute_with_openai(Task(description="Summarize report"))
+        second = await platform.execute_with_openai(Task(description="Summarize report"))
+
+        assert "cache_hit" not in first
+        assert second["cache_hit"] is True
+        assert second["result"] == first["result"]
+
+    @pytest.mark.asyncio
+    async def test_cache_can_be_disabled(self, platform):
+        """Disabling the cache should force fresh execution"""
+        platform.config["response_cache_enabled"] = False
+
+        await platform.execute_with_openai(Task(description="Summarize report"))
+        second = await platform.execute_with_openai(Task(description="Summarize report"))
+
+        assert "cache_hit" not in second
+
+
+class TestSemanticCache:
+    """Test semantic caching of similar task descriptions"""
+
+    @pytest.mark.asyncio
+    async def test_similar_description_hits_cache(self, platform):
+        """Semantically similar descriptions should reuse cached results"""
+        embeddings = {
+            "Review PR #456 for auth middleware": [1.0, 0.1, 0.0],
+            "Audit PR 456 authentication changes": [1.0, 0.12, 0.01],
+            "Deploy the billing service": [0.0, 0.0, 1.0],
+        }
+        platform.enable_semantic_cache(embed_fn=embeddings.__getitem__)
+        platform.config["response_cache_enabled"] = False
+
+        await platform.run(Task(description="Review PR #456 for auth middleware"))
+        similar = await platform.run(Task(description="Audit PR 456 authentication changes"))
+        unrelated = await platform.run(Task(description="Deploy the billing service"))
+
+        assert similar["semantic_cache_hit"] is True
+        assert "semantic_cache_hit" not in unrelated
+
+
+class TestVerifyCache:
+    """Test hybrid verification short-circuiting"""
+
+    @pytest.mark.asyncio
+    async def test_repeat_execution_skips_verification(self, platform):
+        """Identical execution output should reuse the cached verification"""
+        platform.config["response_cache_enabled"] = False
+
+        first = await platform.execute_hybrid_workflow(
+            Task(id="wf1", description="Check service health", requires_multi_step=True)
+        )
+        second = await platform.execute_hybrid_workflow(
+            Task(id="wf2", description="Check service health", requires_multi_step=True)
+        )
+
+        first_verify = first["stages"]["verification"]["output"]
+        second_verify = second["stages"]["verification"]["output"]
+        assert "verify_cache_hit" not in first_verify
+        assert second_verify["verify_cache_hit"] is True
+        assert second_verify["result"] == first_verify["result"]
+
+
 class TestTaskHistory:
     """Test task history tracking"""
 
@@ -134,3 +501,48 @@ class TestTaskHistory:
         history = platform.get_task_history()
         assert len(history) == 1
         assert history[0]["description"] == "Test"
+        assert history[0]["status"] == "completed"
+        assert history[0]["execution_time"] is not None
+
+    @pytest.mark.asyncio
+    async def test_history_snapshot_reflects_status_changes(self, platform):
+        """Cached history entries should refresh when task status changes"""
+        task = Task(description="Pending work")
+        platform.task_history.append(task)
+        assert platform.get_task_history()[0]["status"] == "pending"
+
+        task.mark_started("openai")
+        task.mark_completed({"ok": True})
+        assert platform.get_task_history()[0]["status"] == "completed"
+
+    @pytest.mark.asyncio
+    async def test_history_limit_returns_most_recent(self, platform):
+        """get_task_history(limit) should return the newest tasks, oldest first"""
+        for i in range(5):
+            await platform.run(Task(id=f"t{i}", description=f"Task {i}"))
+
+        recent = platform.get_task_history(limit=2)
+        assert [entry["id"] for entry in recent] == ["t3", "t4"]
+
+    @pytest.mark.asyncio
+    async def test_history_is_bounded(self, platform):
+        """History should evict oldest entries beyond history_size"""
+        platform.task_history = type(platform.task_history)(maxlen=3)
+
+        for i in range(5):
+            await platform.run(Task(id=f"t{i}", description=f"Task {i}"))
+
+        history = platform.get_task_history()
+        assert [entry["id"] for entry in history] == ["t2", "t3", "t4"]
+
+    @pytest.mark.asyncio
+    async def test_history_exports_as_json(self, platform):
+        """export_history_json should emit valid JSON with enum values"""
+        import json
+
+        await platform.run(Task(id="t1", description="Export me"))
+
+        exported = json.loads(platform.export_history_json())
+        assert exported[0]["id"] == "t1"
+        assert exported[0]["status"] == "completed"
+        assert isinstance(exported[0]["created_at"], str)